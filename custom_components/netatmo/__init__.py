@@ -11,7 +11,7 @@ import aiohttp
 
 try:
     from . import pyatmo
-except Exception:  # pylint: disable=broad-except
+except ImportError:
     import pyatmo
 
 from homeassistant.components import cloud
@@ -7,7 +7,7 @@ from aiohttp import ClientSession
 
 try:
     from . import pyatmo
-except Exception:  # pylint: disable=broad-except
+except ImportError:
     import pyatmo
 
 from homeassistant.components import cloud
@@ -10,7 +10,7 @@ import aiohttp
 try:
     from .pyatmo import ApiError as NetatmoApiError, modules as NaModules
     from .pyatmo.event import Event as NaEvent
-except Exception:  # pylint: disable=broad-except
+except ImportError:
     from pyatmo import ApiError as NetatmoApiError, modules as NaModules
     from pyatmo.event import Event as NaEvent
 import voluptuous as vol
@@ -8,7 +8,7 @@ from typing import Any, cast
 try:
     from .pyatmo.modules import NATherm1
     from .pyatmo.modules.device_types import DeviceType
-except Exception:  # pylint: disable=broad-except
+except ImportError:
     from pyatmo.modules import NATherm1
     from pyatmo.modules.device_types import DeviceType
 import voluptuous as vol
@@ -7,7 +7,7 @@ from typing import Any
 
 try:
     from .pyatmo import modules as NaModules
-except Exception:  # pylint: disable=broad-except
+except ImportError:
     from pyatmo import modules as NaModules
 
 from homeassistant.components.cover import (
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from itertools import repeat
 import logging
-from time import time
+from operator import attrgetter
+import random
+from time import monotonic
 from typing import Any
 
 import aiohttp
@@ -17,7 +21,7 @@ try:
         DeviceCategory as NetatmoDeviceCategory,
         DeviceType as NetatmoDeviceType,
     )
-except Exception:  # pylint: disable=broad-except
+except ImportError:
     import pyatmo
     from pyatmo.modules.device_types import (
         DeviceCategory as NetatmoDeviceCategory,
@@ -26,7 +30,7 @@ except Exception:  # pylint: disable=broad-except
 
 from homeassistant.components import cloud
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
@@ -144,8 +148,38 @@ NETATMO_DEV_CALL_LIMITS = {
 CPH_ADJUSTEMENT_DOWN = 0.8
 CPH_ADJUSTEMENT_BACK_UP = 1.1
 
+# cap for the jittered exponential retry backoff on failing publishers
+MAX_BACKOFF_EXPONENT = 4
+# number of consecutive errors after which a publisher is reported as down
+PUBLISHER_FAIL_THRESHOLD = 5
+
+# transient errors during init: log, flag and retry on the next scan tick
+TRANSIENT_INIT_ERRORS = (
+    pyatmo.NoDevice,
+    pyatmo.ApiError,
+    TimeoutError,
+    aiohttp.ClientConnectorError,
+)
+
+NETATMO_TYPE_SIGNAL_MAP: dict[NetatmoDeviceCategory, tuple[str, ...]] = {
+    NetatmoDeviceCategory.camera: (
+        NETATMO_CREATE_CAMERA,
+        NETATMO_CREATE_CAMERA_LIGHT,
+    ),
+    NetatmoDeviceCategory.dimmer: (NETATMO_CREATE_LIGHT, NETATMO_CREATE_SENSOR, NETATMO_CREATE_ENERGY),
+    NetatmoDeviceCategory.shutter: (NETATMO_CREATE_COVER, NETATMO_CREATE_SENSOR, NETATMO_CREATE_ENERGY),
+    NetatmoDeviceCategory.switch: (
+        NETATMO_CREATE_LIGHT,
+        NETATMO_CREATE_SWITCH,
+        NETATMO_CREATE_SENSOR,
+        NETATMO_CREATE_ENERGY,
+    ),
+    NetatmoDeviceCategory.meter: (NETATMO_CREATE_SENSOR, NETATMO_CREATE_ENERGY),
+    NetatmoDeviceCategory.fan: (NETATMO_CREATE_FAN, NETATMO_CREATE_SENSOR, NETATMO_CREATE_ENERGY),
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class NetatmoDevice:
     """Netatmo device class."""
 
@@ -155,7 +189,7 @@ class NetatmoDevice:
     signal_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class NetatmoHome:
     """Netatmo home class."""
 
@@ -165,7 +199,7 @@ class NetatmoHome:
     signal_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class NetatmoRoom:
     """Netatmo room class."""
 
@@ -175,7 +209,7 @@ class NetatmoRoom:
     signal_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class NetatmoPublisher:
     """Class for keeping track of Netatmo data class metadata."""
 
@@ -184,6 +218,7 @@ class NetatmoPublisher:
     next_scan: float
     target: Any
     subscriptions: set[CALLBACK_TYPE | None]
+    subscription_jobs: dict[CALLBACK_TYPE, HassJob]
     method: str
     kwargs: dict
     num_consecutive_errors: int
@@ -196,6 +231,9 @@ class NetatmoPublisher:
         self.next_scan = next_scan
         self.target = target
         self.subscriptions = subscriptions
+        self.subscription_jobs = {
+            sub: HassJob(sub) for sub in subscriptions if sub is not None
+        }
         self.method = method
         self.kwargs = kwargs
         self.num_consecutive_errors = 0
@@ -205,13 +243,10 @@ class NetatmoPublisher:
         self.num_consecutive_errors = 0
 
     def set_next_scan(self, ts, wait_time=0):
-        # rand_delta = int(self.interval // 8)
-        # rnd = random.randint(0 - rand_delta, rand_delta)
-        # self.next_scan = ts + max(wait_time + abs(rnd), self.interval + rnd)
         self.next_scan = ts + self.interval + wait_time
 
     def is_ts_allows_emission(self, ts):
-        return self.next_scan <= ts  # + max(self.data_handler._scan_interval, self.interval // 12)
+        return self.next_scan <= ts
 
 
 class NetatmoDataHandler:
@@ -244,7 +279,7 @@ class NetatmoDataHandler:
 
         self._10s_rate_limit = limits[CALL_PER_TEN_SECONDS]
 
-        self.rolling_hour = [] # used to store API calls and have a rolling windws of calls
+        self.rolling_hour = deque() # used to store API calls and have a rolling windws of calls
         self._adjusted_hourly_rate_limit = None
         self._last_cph_change = None
 
@@ -253,14 +288,13 @@ class NetatmoDataHandler:
 
         self.adjust_per_scan_numbers()
 
-    def add_api_call(self, n):
+    def add_api_call(self, n, now=None):
         """Add an API call to the rolling window of calls."""
-        current = time()
-        for i in range(n):
-            self.rolling_hour.append(current)
+        current = monotonic() if now is None else now
+        self.rolling_hour.extend(repeat(current, n))
 
         while len(self.rolling_hour) > 0 and current - self.rolling_hour[0] > 3600:
-            self.rolling_hour.pop(0)
+            self.rolling_hour.popleft()
 
     def get_current_calls_count_per_hour(self):
         return int(len(self.rolling_hour))
@@ -274,11 +308,8 @@ class NetatmoDataHandler:
                 await self.account.async_update_topology(disabled_homes_ids=disabled_homes)
                 self.add_api_call(1)
 
-            except (pyatmo.NoDevice, pyatmo.ApiError) as err:
-                _LOGGER.debug("init account.async_update_topology error NoDevice or ApiError %s", err)
-                has_error = True
-            except (TimeoutError, aiohttp.ClientConnectorError) as err:
-                _LOGGER.debug("init account.async_update_topology error Timeout or ClientConnectorError: %s",  err)
+            except TRANSIENT_INIT_ERRORS as err:
+                _LOGGER.debug("init account.async_update_topology transient error %s", err)
                 has_error = True
             except Exception as err:
                 _LOGGER.debug("init account.async_update_topology error unknown %s",  err)
@@ -305,14 +336,8 @@ class NetatmoDataHandler:
                     try:
                         await self.account.async_update_status(h)
                         num_calls += 1
-                    except pyatmo.ApiHomeReachabilityError as err:
-                        _LOGGER.debug("init account.async_update_status error Not Reachable Home: %s", err)
-                        has_error = True
-                    except (pyatmo.NoDevice, pyatmo.ApiError) as err:
-                        _LOGGER.debug("init account.async_update_status error NoDevice or ApiError %s", err)
-                        has_error = True
-                    except (TimeoutError, aiohttp.ClientConnectorError) as err:
-                        _LOGGER.debug("init account.async_update_status error Timeout or ClientConnectorError: %s", err)
+                    except TRANSIENT_INIT_ERRORS as err:
+                        _LOGGER.debug("init account.async_update_status transient error %s", err)
                         has_error = True
                     except Exception as err:
                         _LOGGER.debug("init account.async_update_status error unknown %s", err)
@@ -390,18 +415,27 @@ class NetatmoDataHandler:
         return num_cph
 
     def get_publisher_candidates(self, current, n):
-        self._sorted_publisher = sorted(self._sorted_publisher, key=lambda x: x.next_scan)
+        """Select up to n publishers that are due at the given timestamp.
+
+        Publishers are kept in a list re-sorted by next_scan deadline each
+        tick; as the list stays mostly sorted between ticks this is cheaper
+        than a heap, which adjust_intervals_to_target and _spread_next_scans
+        would have to rebuild wholesale anyway when they reshuffle deadlines.
+        """
+        self._sorted_publisher.sort(key=attrgetter("next_scan"))
         # get the ones with the "older" not handled publisher
 
         candidates = []
         num_predicted_calls = 0
         for p in self._sorted_publisher:
+            if not p.is_ts_allows_emission(current):
+                # the list is sorted by next_scan: nothing further is due
+                break
             if p.name is not None:
-                if p.is_ts_allows_emission(current):
-                    if num_predicted_calls + 1 > n:
-                        break
-                    num_predicted_calls += 1
-                    candidates.append(p)
+                if num_predicted_calls + 1 > n:
+                    break
+                num_predicted_calls += 1
+                candidates.append(p)
 
         return candidates, num_predicted_calls
 
@@ -421,7 +455,7 @@ class NetatmoDataHandler:
                                    redo_next_scan=True,
                                    do_wait_scan_for_cph_to_target=False):
 
-        current = int(time())
+        current = int(monotonic())
 
         if target is None:
             if self._adjusted_hourly_rate_limit is None:
@@ -480,11 +514,13 @@ class NetatmoDataHandler:
         if await self._do_complete_init_if_needed() is False:
             _LOGGER.info("Netatmo integration not yet initialized, trying again in %i seconds", self._scan_interval)
 
+        current = int(monotonic())
+
         # no need all the time but fairly quick
         self.adjust_intervals_to_target()
 
         # keep cph up to date whatever happens (time increment)
-        self.add_api_call(0)
+        self.add_api_call(0, now=current)
 
         cph_init = self.get_current_calls_count_per_hour()
 
@@ -497,14 +533,17 @@ class NetatmoDataHandler:
                          self._adjusted_hourly_rate_limit, self.get_current_calls_count_per_hour())
             delta_sleep = 0
 
-        current = int(time())
-
         candidates, num_predicted_calls = self.get_publisher_candidates(current, num_call)
 
         if len(candidates) <= 1:
             delta_sleep = 0
 
+        # the due publishers are fetched serially on purpose: the pacing
+        # sleep spreads the calls across the scan window to stay under the
+        # 10 s API quota, and a throttling error must stop the remaining
+        # fetches at once, neither of which a concurrent gather can honor
         has_been_throttled = False
+        last_candidate = candidates[-1] if candidates else None
         for data_class in candidates:
 
             if publisher := data_class.name:
@@ -517,17 +556,32 @@ class NetatmoDataHandler:
                     data_class.num_consecutive_errors += 1
                     _LOGGER.debug("Error on publisher: %s, num_errors: %i",
                                   publisher, data_class.num_consecutive_errors)
-                    # Try again a bit later, this is not a rate limit
-                    data_class.next_scan = current + self._scan_interval  # *(data_class.num_consecutive_errors + 1)
+                    # Try again a bit later, this is not a rate limit: back off
+                    # exponentially with full jitter so repeatedly failing
+                    # publishers spread out instead of re-hitting together
+                    backoff = self._scan_interval * (
+                        2 ** min(data_class.num_consecutive_errors - 1, MAX_BACKOFF_EXPONENT)
+                    )
+                    data_class.next_scan = (
+                        current + self._scan_interval + random.uniform(0, backoff)
+                    )
+                    if data_class.num_consecutive_errors == PUBLISHER_FAIL_THRESHOLD:
+                        _LOGGER.info(
+                            "Publisher %s failed %i times in a row, probing it"
+                            " at most every %i seconds until it recovers",
+                            publisher,
+                            PUBLISHER_FAIL_THRESHOLD,
+                            int(self._scan_interval + backoff),
+                        )
                 else:
-                    self.publisher[publisher].push_emission(current)
-                    self.publisher[publisher].set_next_scan(current)
+                    data_class.push_emission(current)
+                    data_class.set_next_scan(current)
 
-            if delta_sleep > 0:
+            if delta_sleep > 0 and data_class is not last_candidate:
                 await asyncio.sleep(delta_sleep)
 
         cph = self.get_current_calls_count_per_hour()
-        current = int(time())
+        current = int(monotonic())
         msg = "Calls per hour: %i , num call asked: %i num candidates: %i num call predicted : %i  num pub: %i"
         _LOGGER.debug(msg, cph, num_call, len(candidates), num_predicted_calls, len(self._sorted_publisher))
 
@@ -557,34 +611,48 @@ class NetatmoDataHandler:
 
     @callback
     def async_force_update(self, signal_name: str) -> None:
-        """Prioritize data retrieval for given data class entry."""
+        """Prioritize data retrieval for given data class entry.
+
+        Only the next_scan deadline is touched, so a burst of force
+        updates (e.g. a camera reconnection storm) collapses into a
+        single fetch on the following scheduler tick.
+        """
         self.publisher[signal_name].next_scan = 0
 
-    async def handle_event(self, event: dict) -> None:
-        """Handle webhook events."""
-        if event["data"][WEBHOOK_PUSH_TYPE] == WEBHOOK_ACTIVATION:
-            _LOGGER.info("%s webhook successfully registered", MANUFACTURER)
-            self._webhook = True
+    def _handle_webhook_activation(self) -> None:
+        _LOGGER.info("%s webhook successfully registered", MANUFACTURER)
+        self._webhook = True
 
-        elif event["data"][WEBHOOK_PUSH_TYPE] == WEBHOOK_DEACTIVATION:
-            _LOGGER.info("%s webhook unregistered", MANUFACTURER)
-            self._webhook = False
+    def _handle_webhook_deactivation(self) -> None:
+        _LOGGER.info("%s webhook unregistered", MANUFACTURER)
+        self._webhook = False
 
-        elif event["data"][WEBHOOK_PUSH_TYPE] == WEBHOOK_NACAMERA_CONNECTION:
-            _LOGGER.debug("%s camera reconnected", MANUFACTURER)
-            self.async_force_update(ACCOUNT)
+    def _handle_webhook_nacamera_connection(self) -> None:
+        _LOGGER.debug("%s camera reconnected", MANUFACTURER)
+        self.async_force_update(ACCOUNT)
+
+    _WEBHOOK_HANDLERS = {
+        WEBHOOK_ACTIVATION: _handle_webhook_activation,
+        WEBHOOK_DEACTIVATION: _handle_webhook_deactivation,
+        WEBHOOK_NACAMERA_CONNECTION: _handle_webhook_nacamera_connection,
+    }
+
+    async def handle_event(self, event: dict) -> None:
+        """Handle webhook events."""
+        if handler := self._WEBHOOK_HANDLERS.get(event["data"][WEBHOOK_PUSH_TYPE]):
+            handler(self)
 
     async def async_fetch_data(self, signal_name: str, update_only=False) -> (bool, bool):
         """Fetch data and notify."""
         has_error = False
         has_throttling_error = False
 
+        pub = self.publisher[signal_name]
+
         if update_only is False:
 
             try:
-                await getattr(self.publisher[signal_name].target, self.publisher[signal_name].method)(
-                    **self.publisher[signal_name].kwargs
-                )
+                await getattr(pub.target, pub.method)(**pub.kwargs)
             except pyatmo.NoDevice as err:
                 _LOGGER.debug("fetch error NoDevice: %s", err)
                 has_error = True
@@ -606,9 +674,8 @@ class NetatmoDataHandler:
 
             self.add_api_call(1)
 
-        for update_callback in self.publisher[signal_name].subscriptions:
-            if update_callback:
-                update_callback()
+        for job in pub.subscription_jobs.values():
+            self.hass.async_run_hass_job(job)
 
         return has_error, has_throttling_error
 
@@ -636,9 +703,11 @@ class NetatmoDataHandler:
             **kwargs: Any
     ) -> None:
         """Subscribe to publisher."""
-        if signal_name in self.publisher:
-            if update_callback not in self.publisher[signal_name].subscriptions:
-                self.publisher[signal_name].subscriptions.add(update_callback)
+        if (pub := self.publisher.get(signal_name)) is not None:
+            if update_callback not in pub.subscriptions:
+                pub.subscriptions.add(update_callback)
+                if update_callback is not None:
+                    pub.subscription_jobs[update_callback] = HassJob(update_callback)
             return
 
         if target is None:
@@ -650,10 +719,10 @@ class NetatmoDataHandler:
             kwargs = {"disabled_homes_ids": self.config_entry.options.get(CONF_DISABLED_HOMES, [])}
 
         interval = int(self._limits[publisher])
-        self.publisher[signal_name] = NetatmoPublisher(
+        self.publisher[signal_name] = pub = NetatmoPublisher(
             name=signal_name,
             interval=interval,
-            next_scan=time() + interval // 2,  # start sooner at start to get some data points
+            next_scan=monotonic() + interval // 2,  # start sooner at start to get some data points
             target=target,
             subscriptions={update_callback},
             method=PUBLISHERS[publisher],
@@ -669,7 +738,7 @@ class NetatmoDataHandler:
             _LOGGER.debug("Publisher %s removed at subscription due to mal formed response!!!!!!", signal_name)
             raise
 
-        self._sorted_publisher.append(self.publisher[signal_name])
+        self._sorted_publisher.append(pub)
         _LOGGER.debug("Publisher %s added", signal_name)
 
         # do spread each time, not very efficient but done only at start
@@ -677,7 +746,7 @@ class NetatmoDataHandler:
 
     def _spread_next_scans(self, wait_time=0):
         intervals = {}
-        current = int(time())
+        current = int(monotonic())
 
         for p in self._sorted_publisher:
             if p.interval not in intervals:
@@ -698,13 +767,18 @@ class NetatmoDataHandler:
         self, signal_name: str, update_callback: CALLBACK_TYPE | None
     ) -> None:
         """Unsubscribe from publisher."""
-        if update_callback not in self.publisher[signal_name].subscriptions:
+        pub = self.publisher[signal_name]
+        if update_callback not in pub.subscriptions:
             return
 
-        self.publisher[signal_name].subscriptions.remove(update_callback)
+        pub.subscriptions.remove(update_callback)
+        pub.subscription_jobs.pop(update_callback, None)
 
-        if not self.publisher[signal_name].subscriptions:
-            self._sorted_publisher = [p for p in self._sorted_publisher if p.name != signal_name]
+        if not pub.subscriptions:
+            try:
+                self._sorted_publisher.remove(pub)
+            except ValueError:
+                pass
             self.publisher.pop(signal_name)
             _LOGGER.debug("Publisher %s removed", signal_name)
 
@@ -715,16 +789,30 @@ class NetatmoDataHandler:
 
     async def async_dispatch(self) -> None:
         """Dispatch the creation of entities."""
-        await self.subscribe(WEATHER, WEATHER, None)
-        await self.subscribe(AIR_CARE, AIR_CARE, None)
+        # the initial subscriptions are independent I/O bound fetches,
+        # run them concurrently instead of awaiting them one by one
+        await asyncio.gather(
+            self.subscribe(WEATHER, WEATHER, None),
+            self.subscribe(AIR_CARE, AIR_CARE, None),
+        )
 
         self.setup_air_care()
 
+        subscriptions = []
         for home in self.account.homes.values():
             signal_home = f"{HOME}-{home.entity_id}"
+            subscriptions.append(
+                self.subscribe(HOME, signal_home, None, home_id=home.entity_id)
+            )
+            subscriptions.append(
+                self.subscribe(EVENT, signal_home, None, home_id=home.entity_id)
+            )
 
-            await self.subscribe(HOME, signal_home, None, home_id=home.entity_id)
-            await self.subscribe(EVENT, signal_home, None, home_id=home.entity_id)
+        if subscriptions:
+            await asyncio.gather(*subscriptions)
+
+        for home in self.account.homes.values():
+            signal_home = f"{HOME}-{home.entity_id}"
 
             self.setup_climate_schedule_select(home, signal_home)
             self.setup_rooms(home, signal_home)
@@ -754,27 +842,15 @@ class NetatmoDataHandler:
 
     def setup_modules(self, home: pyatmo.Home, signal_home: str) -> None:
         """Set up modules."""
-        netatmo_type_signal_map = {
-            NetatmoDeviceCategory.camera: [
-                NETATMO_CREATE_CAMERA,
-                NETATMO_CREATE_CAMERA_LIGHT,
-            ],
-            NetatmoDeviceCategory.dimmer: [NETATMO_CREATE_LIGHT, NETATMO_CREATE_SENSOR, NETATMO_CREATE_ENERGY],
-            NetatmoDeviceCategory.shutter: [NETATMO_CREATE_COVER, NETATMO_CREATE_SENSOR, NETATMO_CREATE_ENERGY],
-            NetatmoDeviceCategory.switch: [
-                NETATMO_CREATE_LIGHT,
-                NETATMO_CREATE_SWITCH,
-                NETATMO_CREATE_SENSOR,
-                NETATMO_CREATE_ENERGY,
-            ],
-            NetatmoDeviceCategory.meter: [NETATMO_CREATE_SENSOR, NETATMO_CREATE_ENERGY],
-            NetatmoDeviceCategory.fan: [NETATMO_CREATE_FAN, NETATMO_CREATE_SENSOR, NETATMO_CREATE_ENERGY],
-        }
+        hass = self.hass
+        home_id = home.entity_id
         for module in home.modules.values():
             if not module.device_category:
                 continue
 
-            signals = netatmo_type_signal_map.get(module.device_category, [])
+            signals = NETATMO_TYPE_SIGNAL_MAP.get(module.device_category)
+            if signals is None:
+                signals = ()
 
 
             # unfortunately the ecoounter is handled in a very peculiar way
@@ -807,23 +883,23 @@ class NetatmoDataHandler:
 
             for signal in signals:
                 async_dispatcher_send(
-                    self.hass,
+                    hass,
                     signal,
                     NetatmoDevice(
                         self,
                         module,
-                        home.entity_id,
+                        home_id,
                         signal_home,
                     ),
                 )
             if module.device_category is NetatmoDeviceCategory.weather:
                 async_dispatcher_send(
-                    self.hass,
+                    hass,
                     NETATMO_CREATE_WEATHER_SENSOR,
                     NetatmoDevice(
                         self,
                         module,
-                        home.entity_id,
+                        home_id,
                         WEATHER,
                     ),
                 )
@@ -872,9 +948,10 @@ class NetatmoDataHandler:
         self, home: pyatmo.Home, signal_home: str
     ) -> None:
         """Set up climate schedule per home."""
-        if NetatmoDeviceCategory.climate in [
-            next(iter(x)) for x in [room.features for room in home.rooms.values()] if x
-        ]:
+        if any(
+            NetatmoDeviceCategory.climate in room.features
+            for room in home.rooms.values()
+        ):
             self.hass.data[DOMAIN][DATA_SCHEDULES][home.entity_id] = self.account.homes[
                 home.entity_id
             ].schedules
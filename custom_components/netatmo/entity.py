@@ -9,7 +9,7 @@ try:
     from .pyatmo import DeviceType, Home, Module, Room
     from .pyatmo.modules.base_class import NetatmoBase, Place
     from .pyatmo.modules.device_types import DEVICE_DESCRIPTION_MAP
-except Exception:  # pylint: disable=broad-except
+except ImportError:
     from pyatmo import DeviceType, Home, Module, Room
     from pyatmo.modules.base_class import NetatmoBase, Place
     from pyatmo.modules.device_types import DEVICE_DESCRIPTION_MAP
@@ -80,10 +80,7 @@ class NetatmoBaseEntity(Entity):
                     publisher["name"], signal_name, self.async_update_callback
                 )
 
-            if any(
-                sub is None
-                for sub in self.data_handler.publisher[signal_name].subscriptions
-            ):
+            if None in self.data_handler.publisher[signal_name].subscriptions:
                 await self.data_handler.unsubscribe(signal_name, None)
 
         self.async_update_callback()
@@ -135,11 +132,12 @@ class NetatmoRoomEntity(NetatmoDeviceEntity):
     def __init__(self, room: NetatmoRoom) -> None:
         """Set up a Netatmo room entity."""
         super().__init__(room.data_handler, room.room)
+        manufacturer, model = self.device_description
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, room.room.entity_id)},
             name=room.room.name,
-            manufacturer=self.device_description[0],
-            model=self.device_description[1],
+            manufacturer=manufacturer,
+            model=model,
             configuration_url=CONF_URL_ENERGY,
             suggested_area=room.room.name,
         )
@@ -169,11 +167,12 @@ class NetatmoModuleEntity(NetatmoDeviceEntity):
     def __init__(self, device: NetatmoDevice) -> None:
         """Set up a Netatmo module entity."""
         super().__init__(device.data_handler, device.device)
+        manufacturer, model = self.device_description
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, device.device.entity_id)},
             name=device.device.name,
-            manufacturer=self.device_description[0],
-            model=self.device_description[1],
+            manufacturer=manufacturer,
+            model=model,
             configuration_url=self._attr_configuration_url,
         )
 
@@ -191,7 +190,7 @@ class NetatmoWeatherModuleEntity(NetatmoModuleEntity):
     def __init__(self, device: NetatmoDevice) -> None:
         """Set up a Netatmo weather module entity."""
         super().__init__(device)
-        category = getattr(self.device.device_category, "name")
+        category = self.device.device_category.name
         self._publishers.extend(
             [
                 {
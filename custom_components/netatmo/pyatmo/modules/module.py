@@ -655,6 +655,10 @@ ENERGY_FILTERS = f"{MeasureType.SUM_ENERGY_ELEC.value},{MeasureType.SUM_ENERGY_E
 ENERGY_FILTERS_LEGACY = f"{MeasureType.SUM_ENERGY_ELEC_LEGACY.value},{MeasureType.SUM_ENERGY_ELEC_BASIC_LEGACY.value},{MeasureType.SUM_ENERGY_ELEC_PEAK_LEGACY.value},{MeasureType.SUM_ENERGY_ELEC_OFF_PEAK_LEGACY.value}"
 ENERGY_FILTERS_MODES = ["generic", "basic", "peak", "off_peak"]
 
+# below this horizon the power history cannot hold more than one sample,
+# so the Riemann adjustment is necessarily 0 and the walk can be skipped
+MIN_POWER_ADJUSTMENT_INTERVAL = 30
+
 
 def compute_riemann_sum(
     power_data: list[tuple[int, float]],
@@ -668,19 +672,20 @@ def compute_riemann_sum(
         # as we don't want to artifically go up the previous one
         # (except in rare exceptions like reset, 0 , etc)
 
-        for i in range(len(power_data) - 1):
-            dt_h = float(power_data[i + 1][0] - power_data[i][0]) / 3600.0
-
-            if conservative:
-                d_p_w = 0.0
-            else:
-                d_p_w = abs(float(power_data[i + 1][1] - power_data[i][1]))
-
-            d_nrj_wh = dt_h * (
-                min(power_data[i + 1][1], power_data[i][1]) + 0.5 * d_p_w
-            )
-
-            delta_energy += d_nrj_wh
+        it = iter(power_data)
+        prev_ts, prev_power = next(it)
+        if conservative:
+            for ts, power in it:
+                delta_energy += (ts - prev_ts) / 3600.0 * min(power, prev_power)
+                prev_ts, prev_power = ts, power
+        else:
+            for ts, power in it:
+                delta_energy += (
+                    (ts - prev_ts)
+                    / 3600.0
+                    * (min(power, prev_power) + 0.5 * abs(power - prev_power))
+                )
+                prev_ts, prev_power = ts, power
 
     return delta_energy
 
@@ -739,7 +744,7 @@ class EnergyHistoryMixin(EntityBase):
 
             if (
                 from_ts is not None
-                and from_ts < to_ts
+                and to_ts - from_ts >= MIN_POWER_ADJUSTMENT_INTERVAL
                 and isinstance(self, PowerMixin)
                 and isinstance(self, NetatmoBase)
             ):
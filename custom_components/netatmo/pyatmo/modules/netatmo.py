@@ -207,11 +207,13 @@ class PublicWeatherArea:
         self.modules = []
         self.required_data_type = required_data_type
         self.filtering = filtering
+        self._measure_cache: dict[str, dict[str, Any]] = {}
 
     def update(self, raw_data: RawData) -> None:
         """Update public weather area with the latest data."""
 
         self.modules = list(raw_data.get("public", []))
+        self._measure_cache.clear()
 
     def stations_in_area(self) -> int:
         """Return available number of stations in area."""
@@ -262,7 +264,10 @@ class PublicWeatherArea:
     def get_latest_station_measures(self, data_type: str) -> dict[str, Any]:
         """Return latest station measures of a given type."""
 
-        measures: dict[str, Any] = {}
+        if (measures := self._measure_cache.get(data_type)) is not None:
+            return measures
+
+        measures = {}
         for station in self.modules:
             for module in station["measures"].values():
                 if (
@@ -272,20 +277,25 @@ class PublicWeatherArea:
                     and module["res"]
                 ):
                     measure_index = module["type"].index(data_type)
-                    latest_timestamp = sorted(module["res"], reverse=True)[0]
+                    latest_timestamp = max(module["res"])
                     measures[station["_id"]] = module["res"][latest_timestamp][
                         measure_index
                     ]
 
+        self._measure_cache[data_type] = measures
         return measures
 
     def get_accessory_data(self, data_type: str) -> dict[str, Any]:
         """Return accessory data of a given type."""
 
-        data: dict[str, Any] = {}
+        if (data := self._measure_cache.get(data_type)) is not None:
+            return data
+
+        data = {}
         for station in self.modules:
             for module in station["measures"].values():
                 if data_type in module:
                     data[station["_id"]] = module[data_type]
 
+        self._measure_cache[data_type] = data
         return data
@@ -71,9 +71,12 @@ class NetatmoScheduleSelect(NetatmoBaseEntity, SelectEntity):
         self._attr_unique_id = f"{self.home.entity_id}-schedule-select"
 
         self._attr_current_option = getattr(self.home.get_selected_schedule(), "name")
-        self._attr_options = [
-            schedule.name for schedule in self.home.schedules.values() if schedule.name
-        ]
+        self._schedule_ids_by_name = {
+            schedule.name: sid
+            for sid, schedule in self.home.schedules.items()
+            if schedule.name
+        }
+        self._attr_options = list(self._schedule_ids_by_name)
 
     async def async_added_to_hass(self) -> None:
         """Entity created."""
@@ -106,19 +109,15 @@ class NetatmoScheduleSelect(NetatmoBaseEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        for sid, schedule in self.hass.data[DOMAIN][DATA_SCHEDULES][
-            self.home.entity_id
-        ].items():
-            if schedule.name != option:
-                continue
-            _LOGGER.debug(
-                "Setting %s schedule to %s (%s)",
-                self.home.entity_id,
-                option,
-                sid,
-            )
-            await self.home.async_switch_schedule(schedule_id=sid)
-            break
+        if (sid := self._schedule_ids_by_name.get(option)) is None:
+            return
+        _LOGGER.debug(
+            "Setting %s schedule to %s (%s)",
+            self.home.entity_id,
+            option,
+            sid,
+        )
+        await self.home.async_switch_schedule(schedule_id=sid)
 
     @callback
     def async_update_callback(self) -> None:
@@ -127,6 +126,9 @@ class NetatmoScheduleSelect(NetatmoBaseEntity, SelectEntity):
         self.hass.data[DOMAIN][DATA_SCHEDULES][self.home.entity_id] = (
             self.home.schedules
         )
-        self._attr_options = [
-            schedule.name for schedule in self.home.schedules.values() if schedule.name
-        ]
+        self._schedule_ids_by_name = {
+            schedule.name: sid
+            for sid, schedule in self.home.schedules.items()
+            if schedule.name
+        }
+        self._attr_options = list(self._schedule_ids_by_name)
@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from bisect import bisect_right
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 import logging
+from operator import attrgetter
+from time import time
 from typing import Any, cast
 
 try:
     from . import pyatmo
     from .pyatmo.modules import PublicWeatherArea
     from .pyatmo.modules.module import EnergyHistoryMixin, MeasureInterval
-except Exception:  # pylint: disable=broad-except
+except ImportError:
     import pyatmo
     from pyatmo.modules import PublicWeatherArea
     from pyatmo.modules.module import EnergyHistoryMixin, MeasureInterval
@@ -96,42 +99,33 @@ DIRECTION_OPTIONS = [
 ]
 
 
+HEALTH_LABELS = ("healthy", "fine", "fair", "poor")
+
+
 def process_health(health: StateType) -> str | None:
     """Process health index and return string for display."""
     if not isinstance(health, int):
         return None
-    return {
-        0: "healthy",
-        1: "fine",
-        2: "fair",
-        3: "poor",
-    }.get(health, "unhealthy")
+    return HEALTH_LABELS[health] if 0 <= health < len(HEALTH_LABELS) else "unhealthy"
+
+
+SIGNAL_LABELS = ("Full", "High", "Medium", "Low")
+RF_THRESHOLDS = (60, 76, 90)
+WIFI_THRESHOLDS = (56, 71, 86)
 
 
 def process_rf(strength: StateType) -> str | None:
-    """Process wifi signal strength and return string for display."""
+    """Process rf signal strength and return string for display."""
     if not isinstance(strength, int):
         return None
-    if strength >= 90:
-        return "Low"
-    if strength >= 76:
-        return "Medium"
-    if strength >= 60:
-        return "High"
-    return "Full"
+    return SIGNAL_LABELS[bisect_right(RF_THRESHOLDS, strength)]
 
 
 def process_wifi(strength: StateType) -> str | None:
     """Process wifi signal strength and return string for display."""
     if not isinstance(strength, int):
         return None
-    if strength >= 86:
-        return "Low"
-    if strength >= 71:
-        return "Medium"
-    if strength >= 56:
-        return "High"
-    return "Full"
+    return SIGNAL_LABELS[bisect_right(WIFI_THRESHOLDS, strength)]
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -300,7 +294,9 @@ SENSOR_TYPES: tuple[NetatmoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
     ),
 )
-SENSOR_TYPES_KEYS = [desc.key for desc in SENSOR_TYPES]
+SENSOR_TYPES_KEYS: frozenset[str] = frozenset(desc.key for desc in SENSOR_TYPES)
+SENSOR_TYPES_BY_NETATMO_NAME = {desc.netatmo_name: desc for desc in SENSOR_TYPES}
+SENSOR_TYPES_BY_KEY = {desc.key: desc for desc in SENSOR_TYPES}
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -499,9 +495,11 @@ async def async_setup_entry(
     @callback
     def _create_weather_sensor_entity(netatmo_device: NetatmoDevice) -> None:
         async_add_entities(
-            NetatmoWeatherSensor(netatmo_device, description)
-            for description in SENSOR_TYPES
-            if description.netatmo_name in netatmo_device.device.features
+            [
+                NetatmoWeatherSensor(netatmo_device, SENSOR_TYPES_BY_NETATMO_NAME[name])
+                for name in netatmo_device.device.features
+                & SENSOR_TYPES_BY_NETATMO_NAME.keys()
+            ]
         )
 
     entry.async_on_unload(
@@ -518,9 +516,10 @@ async def async_setup_entry(
             netatmo_device.device.name,
         )
         async_add_entities(
-            NetatmoSensor(netatmo_device, description)
-            for description in SENSOR_TYPES
-            if description.key in netatmo_device.device.features
+            [
+                NetatmoSensor(netatmo_device, SENSOR_TYPES_BY_KEY[key])
+                for key in netatmo_device.device.features & SENSOR_TYPES_BY_KEY.keys()
+            ]
         )
 
     entry.async_on_unload(
@@ -534,9 +533,10 @@ async def async_setup_entry(
             _LOGGER.debug(msg)
             return
         async_add_entities(
-            NetatmoRoomSensor(netatmo_device, description)
-            for description in SENSOR_TYPES
-            if description.key in netatmo_device.room.features
+            [
+                NetatmoRoomSensor(netatmo_device, SENSOR_TYPES_BY_KEY[key])
+                for key in netatmo_device.room.features & SENSOR_TYPES_BY_KEY.keys()
+            ]
         )
 
     entry.async_on_unload(
@@ -586,8 +586,16 @@ async def async_setup_entry(
                 area_id=str(area.uuid),
             )
 
+            station = data_handler.account.public_weather_areas[str(area.uuid)]
+            slug = area.area_name.replace(" ", "-")
+            area_attrs = {
+                ATTR_LATITUDE: (area.lat_ne + area.lat_sw) / 2,
+                ATTR_LONGITUDE: (area.lon_ne + area.lon_sw) / 2,
+            }
             new_entities.extend(
-                NetatmoPublicSensor(data_handler, area, description)
+                NetatmoPublicSensor(
+                    data_handler, area, description, station, slug, area_attrs
+                )
                 for description in PUBLIC_WEATHER_STATION_TYPES
             )
 
@@ -596,8 +604,16 @@ async def async_setup_entry(
 
         async_add_entities(new_entities)
 
+    @callback
+    def _async_on_public_update() -> None:
+        # keep the dispatcher on its synchronous fast path; the actual
+        # work runs as a task
+        hass.async_create_task(add_public_entities())
+
     async_dispatcher_connect(
-        hass, f"signal-{DOMAIN}-public-update-{entry.entry_id}", add_public_entities
+        hass,
+        f"signal-{DOMAIN}-public-update-{entry.entry_id}",
+        _async_on_public_update,
     )
 
     await add_public_entities(False)
@@ -618,24 +634,32 @@ class NetatmoWeatherSensor(NetatmoWeatherModuleEntity, SensorEntity):
         self.entity_description = description
         self._attr_translation_key = description.netatmo_name
         self._attr_unique_id = f"{self.device.entity_id}-{description.key}"
+        self._last_available: bool | None = None
+        # resolved once: the hot callback and availability paths would
+        # otherwise redo the dotted-string attribute lookup on every tick
+        self._getter = attrgetter(description.netatmo_name)
+        self._value_fn = description.value_fn
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return (
-            self.device.reachable
-            or getattr(self.device, self.entity_description.netatmo_name) is not None
-        )
+        return self.device.reachable or self._getter(self.device) is not None
 
     @callback
     def async_update_callback(self) -> None:
         """Update the entity's state."""
-        value = cast(
-            StateType, getattr(self.device, self.entity_description.netatmo_name)
-        )
+        value = cast(StateType, self._getter(self.device))
         if value is not None:
-            value = self.entity_description.value_fn(value)
+            value = self._value_fn(value)
+
+        # a single device refresh pings every sensor of the station; only
+        # write states that actually changed to keep bus traffic down
+        available = self.available
+        if value == self._attr_native_value and available is self._last_available:
+            return
+
         self._attr_native_value = value
+        self._last_available = available
         self.async_write_ha_state()
 
 
@@ -651,22 +675,21 @@ class NetatmoClimateBatterySensor(NetatmoModuleEntity, SensorEntity):
         super().__init__(netatmo_device)
         self.entity_description = BATTERY_SENSOR_DESCRIPTION
 
-        self._publishers.extend(
-            [
-                {
-                    "name": HOME,
-                    "home_id": netatmo_device.device.home.entity_id,
-                    SIGNAL_NAME: netatmo_device.signal_name,
-                },
-            ]
+        self._publishers.append(
+            {
+                "name": HOME,
+                "home_id": netatmo_device.device.home.entity_id,
+                SIGNAL_NAME: netatmo_device.signal_name,
+            }
         )
 
         self._attr_unique_id = f"{netatmo_device.parent_id}-{self.device.entity_id}-{self.entity_description.key}"
+        manufacturer, model = self.device_description
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, netatmo_device.parent_id)},
             name=netatmo_device.device.name,
-            manufacturer=self.device_description[0],
-            model=self.device_description[1],
+            manufacturer=manufacturer,
+            model=model,
             configuration_url=self._attr_configuration_url,
         )
 
@@ -674,7 +697,7 @@ class NetatmoClimateBatterySensor(NetatmoModuleEntity, SensorEntity):
     def async_update_callback(self) -> None:
         """Update the entity's state."""
         if not self.device.reachable:
-            if self.available:
+            if self._attr_available:
                 self._attr_available = False
             return
 
@@ -701,6 +724,14 @@ class NetatmoBaseSensor(NetatmoModuleEntity, SensorEntity):
             f"{self.device.entity_id}-{self.device.entity_id}-{description.key}"
         )
 
+        # bind the right update path once instead of re-checking the key
+        # string on every callback; only the reachable sensor differs
+        if description.key == "reachable":
+            self._update_impl = self._update_reachable
+        else:
+            self._update_impl = self._update_value
+        self._getter = attrgetter(description.key)
+
         self.complement_publishers(netatmo_device)
 
     @abstractmethod
@@ -710,20 +741,31 @@ class NetatmoBaseSensor(NetatmoModuleEntity, SensorEntity):
     @callback
     def async_update_callback(self) -> None:
         """Update the entity's state."""
+        self._update_impl()
+
+    def _update_value(self) -> None:
+        if not self.device.reachable:
+            if self._attr_available:
+                self._attr_available = False
+            return
 
-        if self.entity_description.key != "reachable":
+        if (state := self._getter(self.device)) is None:
+            return
 
-            if not self.device.reachable:
-                if self.available:
-                    self._attr_available = False
-                return
+        self._write_state(state)
 
-            if (state := getattr(self.device, self.entity_description.key)) is None:
-                return
-        else:
-            state = self.device.reachable
-            if state is None:
-                state = False
+    def _update_reachable(self) -> None:
+        state = self.device.reachable
+        if state is None:
+            state = False
+
+        self._write_state(state)
+
+    def _write_state(self, state) -> None:
+        if state == self._attr_native_value and self._attr_available:
+            # the home refresh pings every sensor; identical values need no
+            # new state machine write
+            return
 
         self._attr_available = True
         self._attr_native_value = state
@@ -735,14 +777,12 @@ class NetatmoSensor(NetatmoBaseSensor):
     """Implementation of a generic Netatmo sensor."""
 
     def complement_publishers(self, netatmo_device):
-        self._publishers.extend(
-            [
-                {
-                    "name": HOME,
-                    "home_id": self.home.entity_id,
-                    SIGNAL_NAME: netatmo_device.signal_name,
-                },
-            ]
+        self._publishers.append(
+            {
+                "name": HOME,
+                "home_id": self.home.entity_id,
+                SIGNAL_NAME: netatmo_device.signal_name,
+            }
         )
 
 
@@ -763,15 +803,17 @@ class NetatmoEnergySensor(NetatmoBaseSensor):
         super().__init__(netatmo_device, description)
 
         strt = datetime.now()
-        if isinstance(self.device, EnergyHistoryMixin):
+        self._is_energy_history = isinstance(self.device, EnergyHistoryMixin)
+        if self._is_energy_history:
             self.device.reset_measures(start_power_time=strt ,in_reset=False)
 
         self._current_start_anchor = datetime.fromisoformat("2024-07-24 00:00:00")
+        self._current_start_anchor_ts = int(self._current_start_anchor.timestamp())
         self._last_val_sent = None
 
     def complement_publishers(self, netatmo_device):
         self._publishers.extend(
-            [
+            (
                 {
                     "name": ENERGY_MEASURE,
                     "target_module": self,
@@ -782,15 +824,16 @@ class NetatmoEnergySensor(NetatmoBaseSensor):
                     "home_id": self.home.entity_id,
                     SIGNAL_NAME: netatmo_device.signal_name,
                 },
-            ]
+            )
         )
 
     async def async_update_energy(self, **kwargs):
 
-        if isinstance(self.device, EnergyHistoryMixin) is False:
+        if self._is_energy_history is False:
             return 0
 
-        end = datetime.now()
+        now_ts = time()
+        end = datetime.fromtimestamp(now_ts)
         start = self._current_start_anchor
 
         #netatmo is only keeping energy measures for 2.5 days, we reset every day
@@ -798,10 +841,11 @@ class NetatmoEnergySensor(NetatmoBaseSensor):
             #force everything at 0
             self.device.reset_measures(start_power_time=end)
             self._current_start_anchor = end
+            self._current_start_anchor_ts = int(now_ts)
             return 0
 
-        end_time = int(end.timestamp())
-        start_time = int(start.timestamp())
+        end_time = int(now_ts)
+        start_time = self._current_start_anchor_ts
 
         num_calls = await self.device.async_update_measures(start_time=start_time,
                                                             end_time=end_time,
@@ -813,7 +857,7 @@ class NetatmoEnergySensor(NetatmoBaseSensor):
     def async_update_callback(self) -> None:
         """Update the entity's state."""
 
-        if isinstance(self.device, EnergyHistoryMixin) is False:
+        if self._is_energy_history is False:
             #please the linter ....
             return
 
@@ -824,8 +868,9 @@ class NetatmoEnergySensor(NetatmoBaseSensor):
             if prev_energy is not None and prev_energy > new_val:
                 new_val = prev_energy
             state = new_val
-            _LOGGER.debug("UPDATE ENERGY FOR: %s delta: %s nrjAPI %s nrj+delta %s prev %s RETAINED: %s",
-                          self.device.name, delta_energy, v, v + delta_energy, prev_energy, state)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("UPDATE ENERGY FOR: %s delta: %s nrjAPI %s nrj+delta %s prev %s RETAINED: %s",
+                              self.device.name, delta_energy, v, v + delta_energy, prev_energy, state)
         else:
             state = 0
             # force only one 0 measure
@@ -852,24 +897,28 @@ class NetatmoRoomSensor(NetatmoRoomEntity, SensorEntity):
         super().__init__(netatmo_room)
         self.entity_description = description
 
-        self._publishers.extend(
-            [
-                {
-                    "name": HOME,
-                    "home_id": self.home.entity_id,
-                    SIGNAL_NAME: netatmo_room.signal_name,
-                },
-            ]
+        self._publishers.append(
+            {
+                "name": HOME,
+                "home_id": self.home.entity_id,
+                SIGNAL_NAME: netatmo_room.signal_name,
+            }
         )
 
         self._attr_unique_id = (
             f"{self.device.entity_id}-{self.device.entity_id}-{description.key}"
         )
+        self._getter = attrgetter(description.key)
 
     @callback
     def async_update_callback(self) -> None:
         """Update the entity's state."""
-        if (state := getattr(self.device, self.entity_description.key)) is None:
+        if (state := self._getter(self.device)) is None:
+            return
+
+        if state == self._attr_native_value:
+            # the home refresh pings every room sensor; identical values
+            # need no new state machine write
             return
 
         self._attr_native_value = state
@@ -877,6 +926,19 @@ class NetatmoRoomSensor(NetatmoRoomEntity, SensorEntity):
         self.async_write_ha_state()
 
 
+def _area_signature(area: NetatmoArea) -> tuple:
+    """Return a cheap-to-compare signature of an area's configuration."""
+    return (
+        area.uuid,
+        area.mode,
+        area.show_on_map,
+        area.lat_ne,
+        area.lat_sw,
+        area.lon_ne,
+        area.lon_sw,
+    )
+
+
 class NetatmoPublicSensor(NetatmoBaseEntity, SensorEntity):
     """Represent a single sensor in a Netatmo."""
 
@@ -887,6 +949,9 @@ class NetatmoPublicSensor(NetatmoBaseEntity, SensorEntity):
         data_handler: NetatmoDataHandler,
         area: NetatmoArea,
         description: NetatmoPublicWeatherSensorEntityDescription,
+        station: PublicWeatherArea,
+        area_slug: str,
+        area_attrs: dict[str, float],
     ) -> None:
         """Initialize the sensor."""
         super().__init__(data_handler)
@@ -905,19 +970,17 @@ class NetatmoPublicSensor(NetatmoBaseEntity, SensorEntity):
             }
         )
 
-        self._station = data_handler.account.public_weather_areas[str(area.uuid)]
+        self._station = station
+        self._value_fn = description.value_fn
 
         self.area = area
+        self._area_sig = _area_signature(area)
         self._mode = area.mode
         self._show_on_map = area.show_on_map
-        self._attr_unique_id = f"{area.area_name.replace(' ', '-')}-{description.key}"
+        self._attr_unique_id = f"{area_slug}-{description.key}"
 
-        self._attr_extra_state_attributes.update(
-            {
-                ATTR_LATITUDE: (area.lat_ne + area.lat_sw) / 2,
-                ATTR_LONGITUDE: (area.lon_ne + area.lon_sw) / 2,
-            }
-        )
+        # the midpoint dict is shared read-only by all sensors of the area
+        self._attr_extra_state_attributes = area_attrs
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, area.area_name)},
             name=area.area_name,
@@ -940,7 +1003,17 @@ class NetatmoPublicSensor(NetatmoBaseEntity, SensorEntity):
 
     async def async_config_update_callback(self, area: NetatmoArea) -> None:
         """Update the entity's config."""
-        if self.area == area:
+        sig = _area_signature(area)
+        if sig == self._area_sig:
+            return
+
+        if sig[0] == self._area_sig[0] and sig[3:] == self._area_sig[3:]:
+            # same area and bounding box: the existing subscription still
+            # covers it, so only pick up the display options
+            self.area = area
+            self._area_sig = sig
+            self._mode = area.mode
+            self._show_on_map = area.show_on_map
             return
 
         await self.data_handler.unsubscribe(
@@ -948,6 +1021,7 @@ class NetatmoPublicSensor(NetatmoBaseEntity, SensorEntity):
         )
 
         self.area = area
+        self._area_sig = sig
         self._signal_name = f"{PUBLIC}-{area.uuid}"
         self._mode = area.mode
         self._show_on_map = area.show_on_map
@@ -964,10 +1038,10 @@ class NetatmoPublicSensor(NetatmoBaseEntity, SensorEntity):
     @callback
     def async_update_callback(self) -> None:
         """Update the entity's state."""
-        data = self.entity_description.value_fn(self._station)
+        data = self._value_fn(self._station)
 
         if not data:
-            if self.available:
+            if self._attr_available:
                 _LOGGER.error(
                     "No station provides %s data in the area %s",
                     self.entity_description.key,
@@ -977,13 +1051,41 @@ class NetatmoPublicSensor(NetatmoBaseEntity, SensorEntity):
             self._attr_available = False
             return
 
-        if values := [x for x in data.values() if x is not None]:
-            if self._mode == "avg":
-                self._attr_native_value = round(sum(values) / len(values), 1)
-            elif self._mode == "max":
-                self._attr_native_value = max(values)
-            elif self._mode == "min":
-                self._attr_native_value = min(values)
+        value = self._attr_native_value
+
+        # aggregate in a single pass over the station values instead of
+        # materializing an intermediate list; the mode branch is hoisted
+        # out of the loop
+        if self._mode == "avg":
+            total = 0.0
+            count = 0
+            for x in data.values():
+                if x is not None:
+                    total += x
+                    count += 1
+            if count:
+                value = round(total / count, 1)
+        elif self._mode == "max":
+            maximum = None
+            for x in data.values():
+                if x is not None and (maximum is None or x > maximum):
+                    maximum = x
+            if maximum is not None:
+                value = maximum
+        elif self._mode == "min":
+            minimum = None
+            for x in data.values():
+                if x is not None and (minimum is None or x < minimum):
+                    minimum = x
+            if minimum is not None:
+                value = minimum
+
+        available = value is not None
+        if value == self._attr_native_value and available is self._attr_available:
+            # public stations update slowly; an identical aggregate needs
+            # no new state machine write
+            return
 
-        self._attr_available = self.native_value is not None
+        self._attr_native_value = value
+        self._attr_available = available
         self.async_write_ha_state()
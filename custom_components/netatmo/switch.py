@@ -7,7 +7,7 @@ from typing import Any
 
 try:
     from .pyatmo import modules as NaModules
-except Exception:  # pylint: disable=broad-except
+except ImportError:
     from pyatmo import modules as NaModules
 
 from homeassistant.components.switch import SwitchEntity
@@ -54,7 +54,7 @@ class NetatmoSwitch(NetatmoModuleEntity, SwitchEntity):
     ) -> None:
         """Initialize the Netatmo device."""
         super().__init__(netatmo_device)
-        self._signal_name = f"{HOME}-{self.home.entity_id}"
+        self._signal_name = netatmo_device.signal_name
         self._publishers.extend(
             [
                 {
@@ -70,7 +70,9 @@ class NetatmoSwitch(NetatmoModuleEntity, SwitchEntity):
     @callback
     def async_update_callback(self) -> None:
         """Update the entity's state."""
-        self._attr_is_on = self.device.on
+        if (state := self.device.on) is self._attr_is_on:
+            return
+        self._attr_is_on = state
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the zone on."""